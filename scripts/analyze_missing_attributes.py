@@ -1,106 +1,51 @@
 #!/usr/bin/env python3
 
-import os
-import yaml
-from pathlib import Path
+from catalog import Catalog, normalize_name, references
 
-def normalize_name(name):
-    """Normalize attribute name for comparison (lowercase, stripped)."""
-    return str(name).strip().lower()
-
-def main():
+def main(catalog=None):
     print("🔍 S4A Dictionary - Missing Attributes Analysis")
     print("━" * 60)
     
-    project_root = Path(__file__).parent.parent
+    catalog = catalog or Catalog()
     
     # 1. Load existing attributes
     existing_attributes = set()
-    attributes_dir = project_root / 'data/attributes'
-    if attributes_dir.exists():
-        for yaml_file in attributes_dir.glob('*.yaml'):
-            with open(yaml_file, 'r') as f:
-                try:
-                    data = yaml.safe_load(f)
-                    if data and 'name' in data:
-                        existing_attributes.add(normalize_name(data['name']))
-                except Exception as e:
-                    print(f"Error reading {yaml_file}: {e}")
+    for yaml_file, data in catalog.items('attributes'):
+        if 'name' in data:
+            existing_attributes.add(normalize_name(data['name']))
 
     print(f"✅ Found {len(existing_attributes)} existing attributes definitions.")
 
     # 2. Scan for used attributes
     used_attributes = {} # name -> list of usage locations
 
-    # Scan Objects
-    objects_dir = project_root / 'data/objects'
-    if objects_dir.exists():
-        for yaml_file in objects_dir.glob('*.yaml'):
-            with open(yaml_file, 'r') as f:
-                try:
-                    data = yaml.safe_load(f)
-                    if not data: continue
-                    
-                    obj_name = data.get('Name', yaml_file.stem)
-                    
-                    # Core Attributes
-                    if 'CoreAttributes' in data and data['CoreAttributes']:
-                        for attr in data['CoreAttributes']:
-                            if 'Name' in attr:
-                                name = normalize_name(attr['Name'])
-                                if name not in used_attributes: used_attributes[name] = []
-                                used_attributes[name].append(f"Object: {obj_name}")
-
-                    # System Perspectives
-                    if 'SystemPerspectives' in data and data['SystemPerspectives']:
-                        for persp_id, persp_data in data['SystemPerspectives'].items():
-                            if 'RelevantAttributes' in persp_data and persp_data['RelevantAttributes']:
-                                for attr in persp_data['RelevantAttributes']:
-                                    if 'Name' in attr:
-                                        name = normalize_name(attr['Name'])
-                                        if name not in used_attributes: used_attributes[name] = []
-                                        used_attributes[name].append(f"Perspective: {persp_id}")
-
-                except Exception as e:
-                    print(f"Error reading object {yaml_file}: {e}")
+    # Scan Objects (Core Attributes and System Perspectives)
+    for yaml_file, data in catalog.items('objects'):
+        obj_name = data.get('Name', yaml_file.stem)
+        for target, persp_id, name in references('objects', data):
+            if target == 'attribute':
+                location = f"Object: {obj_name}" if persp_id is None else f"Perspective: {persp_id}"
+                used_attributes.setdefault(normalize_name(name), []).append(location)
 
     # Scan Views
-    views_dir = project_root / 'data/views'
-    if views_dir.exists():
-        for yaml_file in views_dir.glob('*.yaml'):
-            with open(yaml_file, 'r') as f:
-                try:
-                    data = yaml.safe_load(f)
-                    if not data: continue
-                    
-                    view_title = data.get('Title', yaml_file.stem)
-                    
-                    if 'IncludedAttributes' in data and data['IncludedAttributes']:
-                        for attr in data['IncludedAttributes']:
-                            name = ""
-                            if isinstance(attr, dict):
-                                name = attr.get('Name', '')
-                            else:
-                                name = str(attr)
-                            
-                            if name:
-                                norm_name = normalize_name(name)
-                                if norm_name not in used_attributes: used_attributes[norm_name] = []
-                                used_attributes[norm_name].append(f"View: {view_title}")
-
-                except Exception as e:
-                    print(f"Error reading view {yaml_file}: {e}")
+    for yaml_file, data in catalog.items('views'):
+        view_title = data.get('Title', yaml_file.stem)
+        for _, _, name in references('views', data):
+            used_attributes.setdefault(normalize_name(name), []).append(f"View: {view_title}")
 
     # 3. Compare and Report
+    missing = {name: locations for name, locations in used_attributes.items() if name not in existing_attributes}
+    print_missing(missing)
+
+def print_missing(missing):
+    """Print the report for {normalized name: [usage locations]} of undefined attributes."""
     missing_count = 0
     print("\n❌ Missing Attributes (Used but not defined in data/attributes/):")
     print("━" * 60)
     
-    sorted_missing = sorted([name for name in used_attributes.keys() if name not in existing_attributes])
-    
-    for name in sorted_missing:
+    for name in sorted(missing):
         missing_count += 1
-        locations = used_attributes[name]
+        locations = missing[name]
         # Limit locations display
         loc_str = ", ".join(locations[:3])
         if len(locations) > 3:
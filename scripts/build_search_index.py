@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+"""
+S4A Business Dictionary - Search Index Builder
+Post-build step: splits Hugo's public/index.json into compact per-section
+search payloads used by static/js/search.js.
+
+Usage (after 'hugo build'):
+  python3 scripts/build_search_index.py [--public-dir public]
+
+Output (public/search/):
+  manifest.json       Field order, category/status tables and section files
+  <section>.json      Entries as arrays: [title, permalink, category, status, content, key]
+  *.json.gz/.json.br  Precompressed variants (.br only if the 'brotli' package is installed)
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_VERSION = 1
+FIELDS = ['title', 'permalink', 'category', 'status', 'content', 'key']
+
+# search.js shows at most the first 120 characters of 'content'
+SNIPPET_LENGTH = 120
+
+TOKEN_SPLIT = re.compile(r'\s+')
+
+
+def collapse_whitespace(text):
+    return TOKEN_SPLIT.sub(' ', str(text or '')).strip()
+
+
+def search_key(*parts):
+    """
+    Lowercase search key with each token kept once (first occurrence).
+    search.js matches every query term against the key, so repeated
+    tokens (e.g. attribute names listed by several perspectives) are redundant.
+    """
+    seen = set()
+    tokens = []
+    for part in parts:
+        for token in collapse_whitespace(part).lower().split(' '):
+            if token and token not in seen:
+                seen.add(token)
+                tokens.append(token)
+    return ' '.join(tokens)
+
+
+def snippet(text):
+    text = collapse_whitespace(text)
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    return text[:SNIPPET_LENGTH].rsplit(' ', 1)[0]
+
+
+def encode(value, table, lookup):
+    """Dictionary-encode a repeated string as an index into a shared table."""
+    if value not in lookup:
+        lookup[value] = len(table)
+        table.append(value)
+    return lookup[value]
+
+
+def build(entries):
+    """Return (manifest, {section: payload}) for the entries of index.json."""
+    categories, statuses = [], []
+    category_lookup, status_lookup = {}, {}
+    sections = {}
+    seen_permalinks = set()
+
+    for entry in entries:
+        permalink = entry.get('permalink', '')
+        # The same page can appear twice (e.g. translated/aliased pages)
+        if permalink in seen_permalinks:
+            continue
+        seen_permalinks.add(permalink)
+
+        section = entry.get('section') or 'other'
+        title = collapse_whitespace(entry.get('title'))
+        category = entry.get('category', '')
+        status = entry.get('status', '')
+        content = entry.get('content', '')
+
+        sections.setdefault(section, []).append([
+            title,
+            permalink,
+            encode(category, categories, category_lookup),
+            encode(status, statuses, status_lookup),
+            snippet(content),
+            search_key(title, section, category, status, content),
+        ])
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'fields': FIELDS,
+        'categories': categories,
+        'statuses': statuses,
+        'sections': {
+            section: {'file': f"{section}.json", 'count': len(rows)}
+            for section, rows in sorted(sections.items())
+        },
+    }
+    return manifest, {section: {'entries': rows} for section, rows in sections.items()}
+
+
+def minified(data):
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def write_variants(path, payload):
+    """Write raw, .gz and (if available) .br files; return their sizes."""
+    sizes = {'raw': len(payload)}
+    path.write_bytes(payload)
+
+    # mtime=0 keeps the output byte-identical across builds
+    gz = gzip.compress(payload, compresslevel=9, mtime=0)
+    Path(f"{path}.gz").write_bytes(gz)
+    sizes['gz'] = len(gz)
+
+    if brotli is not None:
+        br = brotli.compress(payload, quality=11)
+        Path(f"{path}.br").write_bytes(br)
+        sizes['br'] = len(br)
+    return sizes
+
+
+def format_size(size):
+    if size is None:
+        return '-'
+    return f"{size / 1024:.1f} KB" if size >= 1024 else f"{size} B"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split Hugo's index.json into compact per-section search payloads.")
+    parser.add_argument('--public-dir', default='public', help="Hugo output directory (default: %(default)s)")
+    args = parser.parse_args()
+
+    print("🔎 S4A Dictionary - Search Index Builder")
+    print("━" * 60)
+
+    project_root = Path(__file__).parent.parent
+    public_dir = project_root / args.public_dir
+    index_file = public_dir / 'index.json'
+    if not index_file.exists():
+        print(f"❌ Error: {index_file} not found. Run 'hugo build' first.", file=sys.stderr)
+        sys.exit(1)
+
+    with open(index_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    manifest, payloads = build(entries)
+
+    search_dir = public_dir / 'search'
+    search_dir.mkdir(parents=True, exist_ok=True)
+
+    report = [('manifest.json', write_variants(search_dir / 'manifest.json', minified(manifest)))]
+    for section, payload in sorted(payloads.items()):
+        report.append((f"{section}.json", write_variants(search_dir / f"{section}.json", minified(payload))))
+
+    original = index_file.read_bytes()
+    original_sizes = {'raw': len(original), 'gz': len(gzip.compress(original, compresslevel=9, mtime=0))}
+
+    print(f"{'File':<24} {'Raw':>10} {'Gzip':>10} {'Brotli':>10}")
+    print("━" * 60)
+    print(f"{'index.json (original)':<24} {format_size(original_sizes['raw']):>10} {format_size(original_sizes['gz']):>10} {'-':>10}")
+    for name, sizes in report:
+        print(f"{name:<24} {format_size(sizes['raw']):>10} {format_size(sizes['gz']):>10} {format_size(sizes.get('br')):>10}")
+
+    totals = {key: sum(sizes.get(key, 0) for _, sizes in report) for key in ('raw', 'gz')}
+    print("━" * 60)
+    print(f"{'Total (split)':<24} {format_size(totals['raw']):>10} {format_size(totals['gz']):>10}")
+    print(f"✅ {len(entries)} entries in {len(payloads)} sections written to {search_dir}")
+    if brotli is None:
+        print("💡 Install 'brotli' (pip install brotli) to also emit .br files.")
+
+
+if __name__ == '__main__':
+    main()
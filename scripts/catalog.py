@@ -0,0 +1,158 @@
+"""
+S4A Business Dictionary - Catalog
+Loads the YAML data files (attributes, objects, views) once and caches them,
+so several scripts run in one process share the same parsed catalog.
+"""
+
+import re
+import time
+from pathlib import Path
+
+KINDS = ('attributes', 'objects', 'views')
+
+
+def normalize_name(name):
+    """Normalize attribute name for comparison (lowercase, stripped)."""
+    return str(name).strip().lower()
+
+
+def to_kebab_case(name):
+    name = str(name).strip().lower()
+    name = re.sub(r'[^a-z0-9]+', '-', name)
+    return name.strip('-')
+
+
+def perspectives(data):
+    """Yield (name, perspective data) for an object's SystemPerspectives; an empty perspective yields {}."""
+    system_perspectives = data.get('SystemPerspectives')
+    if isinstance(system_perspectives, dict):
+        for name, persp_data in system_perspectives.items():
+            yield name, persp_data if isinstance(persp_data, dict) else {}
+
+
+def _names(entries, key, allow_strings=False):
+    for entry in entries if isinstance(entries, list) else ():
+        if isinstance(entry, dict):
+            name = entry.get(key)
+        else:
+            name = entry if allow_strings else None
+        if name:
+            yield str(name)
+
+
+def references(kind, data):
+    """
+    Yield (target kind, perspective, name) for every attribute and view a parsed object or view uses:
+      ('attribute', None, name)         CoreAttributes of an object, IncludedAttributes of a view
+      ('attribute', perspective, name)  RelevantAttributes of a perspective
+      ('view', perspective, view id)    ViewsUsed of a perspective
+    Null sections, entries without a name and malformed entries are skipped.
+    """
+    if kind == 'views':
+        # Views may list attributes as plain strings
+        for name in _names(data.get('IncludedAttributes'), 'Name', allow_strings=True):
+            yield 'attribute', None, name
+    elif kind == 'objects':
+        for name in _names(data.get('CoreAttributes'), 'Name'):
+            yield 'attribute', None, name
+        for persp_name, persp_data in perspectives(data):
+            for name in _names(persp_data.get('RelevantAttributes'), 'Name'):
+                yield 'attribute', persp_name, name
+            for view_id in _names(persp_data.get('ViewsUsed'), 'ref', allow_strings=True):
+                yield 'view', persp_name, view_id
+
+
+# yaml is imported on first use so commands that never parse YAML start faster.
+# The libyaml bindings are an order of magnitude faster when PyYAML was built with them.
+
+def yaml_loader():
+    import yaml
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def yaml_dumper():
+    import yaml
+    return getattr(yaml, 'CDumper', yaml.Dumper)
+
+
+def parse_yaml(stream):
+    """Parse YAML from a string (e.g. a file read from git) or an open file."""
+    import yaml
+    return yaml.load(stream, Loader=yaml_loader())
+
+
+def load_yaml(yaml_file):
+    """Parse one data file."""
+    with open(yaml_file, 'r') as f:
+        return parse_yaml(f)
+
+
+def data_kind(path):
+    """'objects' for 'data/objects/FLIGHT.yaml' (relative to the project root), None for any other path."""
+    parts = Path(path).parts
+    if len(parts) == 3 and parts[0] == 'data' and parts[1] in KINDS and parts[2].endswith('.yaml'):
+        return parts[1]
+    return None
+
+
+class Catalog:
+    def __init__(self, project_root=None):
+        self.project_root = Path(project_root) if project_root else Path(__file__).parent.parent
+        self.load_time = 0.0
+        # yaml_file -> message for data files that could not be parsed
+        self.errors = {}
+        self._entries = {}
+
+    def data_dir(self, kind):
+        return self.project_root / 'data' / kind
+
+    def entries(self, kind):
+        """Return {yaml_file: data} for a data directory, loading it on first use."""
+        if kind not in self._entries:
+            start = time.perf_counter()
+            entries = {}
+            directory = self.data_dir(kind)
+            if directory.exists():
+                for yaml_file in sorted(directory.glob('*.yaml')):
+                    try:
+                        entries[yaml_file] = load_yaml(yaml_file)
+                    except Exception as e:
+                        print(f"Error reading {yaml_file}: {e}")
+                        self.errors[yaml_file] = str(e)
+            self._entries[kind] = entries
+            self.load_time += time.perf_counter() - start
+        return self._entries[kind]
+
+    def items(self, kind):
+        """Yield (yaml_file, data) pairs, skipping empty documents."""
+        for yaml_file, data in self.entries(kind).items():
+            if data:
+                yield yaml_file, data
+
+    def overlay(self, changes):
+        """
+        Return a Catalog sharing this one's parsed entries, with some data files replaced.
+        `changes` maps a data file path to its data, or to None if the file does not exist.
+        """
+        catalog = Catalog(self.project_root)
+        for kind in KINDS:
+            catalog._entries[kind] = dict(self.entries(kind))
+        for yaml_file, data in changes.items():
+            yaml_file = self.project_root / yaml_file
+            entries = catalog._entries[yaml_file.parent.name]
+            if data is None:
+                entries.pop(yaml_file, None)
+            else:
+                entries[yaml_file] = data
+        for kind in KINDS:
+            catalog._entries[kind] = dict(sorted(catalog._entries[kind].items()))
+        return catalog
+
+    def write(self, kind, yaml_file, data):
+        """Write a data file and keep the cached copy in sync."""
+        import yaml
+
+        with open(yaml_file, 'w') as f:
+            yaml.dump(data, f, Dumper=yaml_dumper(), sort_keys=False)
+        self.entries(kind)[Path(yaml_file)] = data
+        self.errors.pop(Path(yaml_file), None)
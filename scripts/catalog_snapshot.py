@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+
+"""
+S4A Business Dictionary - Catalog Snapshot
+Writes the whole catalog to a single binary file that is opened with mmap and
+queried lazily, without parsing any YAML.
+
+Usage:
+  python3 scripts/catalog_snapshot.py build          # write .catalog-snapshot.bin
+  python3 scripts/catalog_snapshot.py missing        # analyze_missing_attributes.py from the snapshot
+  python3 scripts/catalog_snapshot.py find "Flight Number"
+  python3 scripts/catalog_snapshot.py stats
+
+File layout (little-endian):
+  header      magic, version, fingerprint, then (offset, count) for every table
+  strings     u32 offsets (count + 1 entries) followed by UTF-8 data; string id 0 is ""
+  records     fixed-width u32 fields per table (see *_RECORD below); text fields are string ids
+  name_index  (normalized name id, attribute index) sorted by normalized name, for binary search
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+import time
+from pathlib import Path
+
+from catalog import KINDS, normalize_name, perspectives, references
+
+MAGIC = b'S4AC'
+VERSION = 2
+DEFAULT_SNAPSHOT_FILE = '.catalog-snapshot.bin'
+
+TABLES = ('strings', 'attributes', 'objects', 'perspectives', 'views',
+          'relationships', 'usages', 'view_refs', 'name_index')
+
+# magic, version, reserved, source file count, newest source mtime (ns)
+HEADER_PREFIX = struct.Struct('<4sHHIQ')
+TABLE_ENTRY = struct.Struct('<II')  # offset, count
+
+U32 = struct.Struct('<I')
+
+# stem, id, name, normalized name, dataType, status, source
+ATTRIBUTE_RECORD = struct.Struct('<7I')
+# stem, name, status, usage start/count, perspective start/count, relationship start/count
+OBJECT_RECORD = struct.Struct('<9I')
+# object index, name, status, usage start/count, view ref start/count
+PERSPECTIVE_RECORD = struct.Struct('<7I')
+# stem, title, platform, status, usage start/count
+VIEW_RECORD = struct.Struct('<6I')
+# object index, target object, type, dependency
+RELATIONSHIP_RECORD = struct.Struct('<4I')
+# attribute name, normalized name, owner kind, owner index
+USAGE_RECORD = struct.Struct('<4I')
+# normalized name, attribute index
+NAME_INDEX_RECORD = struct.Struct('<2I')
+
+OWNER_OBJECT, OWNER_PERSPECTIVE, OWNER_VIEW = 0, 1, 2
+
+
+def source_files(project_root):
+    for kind in KINDS:
+        yield from (Path(project_root) / 'data' / kind).glob('*.yaml')
+
+
+def source_fingerprint(project_root):
+    """(file count, newest mtime) of the data files, to detect a stale snapshot."""
+    count, newest = 0, 0
+    for yaml_file in source_files(project_root):
+        count += 1
+        newest = max(newest, yaml_file.stat().st_mtime_ns)
+    return count, newest
+
+
+class _StringTable:
+    def __init__(self):
+        self.ids = {'': 0}
+        self.values = ['']
+
+    def add(self, value):
+        value = '' if value is None else str(value)
+        if value not in self.ids:
+            self.ids[value] = len(self.values)
+            self.values.append(value)
+        return self.ids[value]
+
+    def pack(self):
+        encoded = [value.encode('utf-8') for value in self.values]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        return struct.pack(f'<{len(offsets)}I', *offsets) + b''.join(encoded)
+
+
+def build(catalog=None, snapshot_path=None):
+    """Write a snapshot of the catalog (used by 'dictionary.py snapshot')."""
+    from catalog import Catalog
+
+    print("💾 S4A Dictionary - Building Catalog Snapshot")
+    print("━" * 60)
+
+    catalog = catalog or Catalog()
+    snapshot_path = Path(snapshot_path or catalog.project_root / DEFAULT_SNAPSHOT_FILE)
+
+    strings = _StringTable()
+    tables = {name: [] for name in TABLES if name != 'strings'}
+    attribute_index_by_norm = {}
+
+    def add_usages(names, owner_kind, owner_index):
+        start = len(tables['usages'])
+        for name in names:
+            if name:
+                tables['usages'].append(USAGE_RECORD.pack(
+                    strings.add(name), strings.add(normalize_name(name)), owner_kind, owner_index))
+        return start, len(tables['usages']) - start
+
+    for yaml_file, data in catalog.items('attributes'):
+        index = len(tables['attributes'])
+        name = data.get('name', '')
+        norm_id = strings.add(normalize_name(name))
+        tables['attributes'].append(ATTRIBUTE_RECORD.pack(
+            strings.add(yaml_file.stem), strings.add(data.get('id')), strings.add(name), norm_id,
+            strings.add(data.get('dataType')), strings.add(data.get('status')), strings.add(data.get('source'))))
+        if name:
+            attribute_index_by_norm.setdefault(normalize_name(name), (norm_id, index))
+
+    for yaml_file, data in catalog.items('objects'):
+        object_index = len(tables['objects'])
+        # Group references by perspective (None: the object's CoreAttributes)
+        attribute_refs, view_refs = {}, {}
+        for target, persp_name, name in references('objects', data):
+            (view_refs if target == 'view' else attribute_refs).setdefault(persp_name, []).append(name)
+        usage = add_usages(attribute_refs.get(None, []), OWNER_OBJECT, object_index)
+
+        persp_start = len(tables['perspectives'])
+        for persp_name, persp_data in perspectives(data):
+            persp_usage = add_usages(attribute_refs.get(persp_name, []),
+                                     OWNER_PERSPECTIVE, len(tables['perspectives']))
+            view_start = len(tables['view_refs'])
+            for view_id in view_refs.get(persp_name, []):
+                tables['view_refs'].append(U32.pack(strings.add(view_id)))
+            tables['perspectives'].append(PERSPECTIVE_RECORD.pack(
+                object_index, strings.add(persp_name), strings.add(persp_data.get('Status')),
+                *persp_usage, view_start, len(tables['view_refs']) - view_start))
+
+        rel_start = len(tables['relationships'])
+        for rel in data.get('CoreRelationships') or []:
+            tables['relationships'].append(RELATIONSHIP_RECORD.pack(
+                object_index, strings.add(rel.get('object')), strings.add(rel.get('type')),
+                strings.add(rel.get('dependency'))))
+
+        tables['objects'].append(OBJECT_RECORD.pack(
+            strings.add(yaml_file.stem), strings.add(data.get('Name', yaml_file.stem)),
+            strings.add(data.get('Status')), *usage,
+            persp_start, len(tables['perspectives']) - persp_start,
+            rel_start, len(tables['relationships']) - rel_start))
+
+    for yaml_file, data in catalog.items('views'):
+        view_index = len(tables['views'])
+        usage = add_usages([name for _, _, name in references('views', data)], OWNER_VIEW, view_index)
+        tables['views'].append(VIEW_RECORD.pack(
+            strings.add(yaml_file.stem), strings.add(data.get('Title', yaml_file.stem)),
+            strings.add(data.get('Platform')), strings.add(data.get('Status')), *usage))
+
+    for norm_name in sorted(attribute_index_by_norm, key=lambda n: n.encode('utf-8')):
+        tables['name_index'].append(NAME_INDEX_RECORD.pack(*attribute_index_by_norm[norm_name]))
+
+    # Lay out: header, then each table in TABLES order
+    header_size = HEADER_PREFIX.size + TABLE_ENTRY.size * len(TABLES)
+    blobs = {'strings': strings.pack()}
+    counts = {'strings': len(strings.values)}
+    for name, rows in tables.items():
+        blobs[name] = b''.join(rows)
+        counts[name] = len(rows)
+
+    entries = []
+    offset = header_size
+    for name in TABLES:
+        entries.append(TABLE_ENTRY.pack(offset, counts[name]))
+        offset += len(blobs[name])
+
+    file_count, newest = source_fingerprint(catalog.project_root)
+    tmp_path = snapshot_path.with_name(snapshot_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER_PREFIX.pack(MAGIC, VERSION, 0, file_count, newest))
+        f.write(b''.join(entries))
+        for name in TABLES:
+            f.write(blobs[name])
+    # Atomic replace so readers never map a half-written file
+    tmp_path.replace(snapshot_path)
+
+    print(f"✅ Wrote {snapshot_path.name} ({offset / 1024:.1f} KB)")
+    print(f"   • Objects:      {counts['objects']}")
+    print(f"   • Perspectives: {counts['perspectives']}")
+    print(f"   • Views:        {counts['views']}")
+    print(f"   • Attributes:   {counts['attributes']}")
+    print(f"   • Strings:      {counts['strings']}")
+
+
+class Snapshot:
+    """Read-only view over a snapshot file; records are decoded only when accessed."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.file_count, self.newest_mtime = HEADER_PREFIX.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} catalog snapshot")
+
+        self._tables = {}
+        for i, name in enumerate(TABLES):
+            self._tables[name] = TABLE_ENTRY.unpack_from(self._mm, HEADER_PREFIX.size + i * TABLE_ENTRY.size)
+
+        strings_offset, strings_count = self._tables['strings']
+        self._string_offsets = strings_offset
+        self._string_data = strings_offset + (strings_count + 1) * U32.size
+        self._string_cache = {}
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def is_stale(self, project_root):
+        return source_fingerprint(project_root) != (self.file_count, self.newest_mtime)
+
+    def count_changed(self, project_root):
+        """Cheap staleness check: data files were added or removed (no stat, no parsing)."""
+        return sum(1 for _ in source_files(project_root)) != self.file_count
+
+    def count(self, table):
+        return self._tables[table][1]
+
+    def string(self, string_id):
+        value = self._string_cache.get(string_id)
+        if value is None:
+            start, end = struct.unpack_from('<2I', self._mm, self._string_offsets + string_id * U32.size)
+            value = self._mm[self._string_data + start:self._string_data + end].decode('utf-8')
+            self._string_cache[string_id] = value
+        return value
+
+    def _record(self, table, record, index):
+        offset, count = self._tables[table]
+        if not 0 <= index < count:
+            raise IndexError(f"{table} index {index} out of range")
+        return record.unpack_from(self._mm, offset + index * record.size)
+
+    def _iter(self, table, record, start=0, count=None):
+        offset, total = self._tables[table]
+        count = total - start if count is None else count
+        begin = offset + start * record.size
+        return record.iter_unpack(self._mm[begin:begin + count * record.size])
+
+    def attribute(self, index):
+        stem, attr_id, name, _, data_type, status, source = self._record('attributes', ATTRIBUTE_RECORD, index)
+        return {
+            'file': self.string(stem), 'id': self.string(attr_id), 'name': self.string(name),
+            'dataType': self.string(data_type), 'status': self.string(status), 'source': self.string(source),
+        }
+
+    def object(self, index):
+        stem, name, status, usage_start, usage_count, persp_start, persp_count, rel_start, rel_count = \
+            self._record('objects', OBJECT_RECORD, index)
+        return {
+            'file': self.string(stem), 'name': self.string(name), 'status': self.string(status),
+            'attributes': [self.string(u[0]) for u in self._iter('usages', USAGE_RECORD, usage_start, usage_count)],
+            'perspectives': [self.string(p[1]) for p in
+                             self._iter('perspectives', PERSPECTIVE_RECORD, persp_start, persp_count)],
+            'relationships': [
+                {'object': self.string(r[1]), 'type': self.string(r[2]), 'dependency': self.string(r[3])}
+                for r in self._iter('relationships', RELATIONSHIP_RECORD, rel_start, rel_count)
+            ],
+        }
+
+    def perspective(self, index):
+        object_index, name, status, usage_start, usage_count, view_start, view_count = \
+            self._record('perspectives', PERSPECTIVE_RECORD, index)
+        return {
+            'object': self.string(self._record('objects', OBJECT_RECORD, object_index)[1]),
+            'name': self.string(name), 'status': self.string(status),
+            'attributes': [self.string(u[0]) for u in self._iter('usages', USAGE_RECORD, usage_start, usage_count)],
+            'views': [self.string(v[0]) for v in self._iter('view_refs', U32, view_start, view_count)],
+        }
+
+    def view(self, index):
+        stem, title, platform, status, usage_start, usage_count = self._record('views', VIEW_RECORD, index)
+        return {
+            'file': self.string(stem), 'title': self.string(title),
+            'platform': self.string(platform), 'status': self.string(status),
+            'attributes': [self.string(u[0]) for u in self._iter('usages', USAGE_RECORD, usage_start, usage_count)],
+        }
+
+    def find_attribute(self, name):
+        """Binary search the name index; returns the attribute dict or None."""
+        target = normalize_name(name).encode('utf-8')
+        lo, hi = 0, self.count('name_index')
+        while lo < hi:
+            mid = (lo + hi) // 2
+            norm_id, index = self._record('name_index', NAME_INDEX_RECORD, mid)
+            value = self.string(norm_id).encode('utf-8')
+            if value == target:
+                return self.attribute(index)
+            if value < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def missing_attributes(self):
+        """{normalized name: [usage locations]} for attribute names used but not defined."""
+        defined = {norm_id for norm_id, _ in self._iter('name_index', NAME_INDEX_RECORD)}
+        missing = {}
+        for _, norm_id, owner_kind, owner_index in self._iter('usages', USAGE_RECORD):
+            if norm_id in defined:
+                continue
+            if owner_kind == OWNER_OBJECT:
+                location = f"Object: {self.string(self._record('objects', OBJECT_RECORD, owner_index)[1])}"
+            elif owner_kind == OWNER_PERSPECTIVE:
+                location = f"Perspective: {self.string(self._record('perspectives', PERSPECTIVE_RECORD, owner_index)[1])}"
+            else:
+                location = f"View: {self.string(self._record('views', VIEW_RECORD, owner_index)[1])}"
+            missing.setdefault(self.string(norm_id), []).append(location)
+        return missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the binary catalog snapshot.")
+    parser.add_argument('command', nargs='?', default='build', choices=['build', 'missing', 'find', 'stats'])
+    parser.add_argument('name', nargs='?', help="Attribute name for 'find'")
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT_FILE, help="Snapshot file (default: %(default)s)")
+    parser.add_argument('--verify', action='store_true',
+                        help="Also compare modification times, to warn about edited data files (by default only "
+                             "added or removed files are detected)")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    snapshot_path = project_root / args.snapshot
+
+    if args.command == 'build':
+        build(snapshot_path=snapshot_path)
+        return
+
+    if not snapshot_path.exists():
+        print(f"❌ Error: {args.snapshot} not found. Run 'python3 scripts/catalog_snapshot.py build' first.",
+              file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    with Snapshot(snapshot_path) as snapshot:
+        # Without --verify only the file count is compared, which catches scaffold/import runs
+        stale = snapshot.is_stale(project_root) if args.verify else snapshot.count_changed(project_root)
+        if stale:
+            print("⚠️  Snapshot is older than the data files; rebuild it for accurate results.")
+
+        if args.command == 'missing':
+            from analyze_missing_attributes import print_missing
+            print_missing(snapshot.missing_attributes())
+        elif args.command == 'find':
+            if not args.name:
+                parser.error("'find' requires an attribute name")
+            attribute = snapshot.find_attribute(args.name)
+            if attribute is None:
+                print(f"❌ No attribute named '{args.name}'")
+            else:
+                for key, value in attribute.items():
+                    print(f"{key:<10} {value}")
+        else:
+            for table in TABLES:
+                print(f"{table:<14} {snapshot.count(table)}")
+
+    print(f"\n⏱️  Answered in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+
+"""
+S4A Business Dictionary - Catalog Consistency Checker
+Verifies referential and uniqueness constraints across all data files in one pass:
+duplicate attribute IDs/names, CoreRelationships to unknown objects, ViewsUsed to
+unknown views, and generated content files that would collide (e.g. perspective
+slugs or case-only filename differences).
+
+Usage:
+  python3 scripts/check_catalog.py                     # full check
+  python3 scripts/check_catalog.py --staged            # pre-commit: only staged files, as staged
+  python3 scripts/check_catalog.py --since origin/main
+  python3 scripts/check_catalog.py data/objects/FLIGHT.yaml
+
+Extracted facts are cached per file in .catalog-index.json, so unchanged files are
+not re-parsed. In incremental mode only issues of the given files, and references
+from other entities to them, are reported.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from catalog import KINDS, Catalog, data_kind, load_yaml, normalize_name, parse_yaml, perspectives, references
+from dependency_graph import (attribute_content_path, object_content_path, perspective_content_path,
+                              view_content_path)
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_FILE = '.catalog-index.json'
+
+ERROR, WARNING = 'error', 'warning'
+
+
+def extract_facts(kind, yaml_file, data):
+    """Reduce a parsed data file to the keys and references the checks need."""
+    facts = {'kind': kind, 'stem': Path(yaml_file).stem}
+    data = data or {}
+
+    if kind == 'attributes':
+        facts['id'] = data.get('id')
+        facts['name'] = data.get('name')
+
+    elif kind == 'objects':
+        facts['relationships'] = [str(rel.get('object')) for rel in data.get('CoreRelationships') or []
+                                  if isinstance(rel, dict) and rel.get('object')]
+        facts['perspectives'] = [persp_name for persp_name, _ in perspectives(data)]
+        facts['views_used'] = []
+        facts['attribute_refs'] = []
+        for target, persp_name, name in references(kind, data):
+            if target == 'view':
+                facts['views_used'].append([persp_name, name])
+            else:
+                facts['attribute_refs'].append(name)
+
+    elif kind == 'views':
+        facts['attribute_refs'] = [name for _, _, name in references(kind, data)]
+
+    return facts
+
+
+def parse_facts(kind, yaml_file, text=None):
+    """Facts of a data file, parsed from `text` (e.g. its staged content) if given."""
+    try:
+        return extract_facts(kind, yaml_file, load_yaml(yaml_file) if text is None else parse_yaml(text))
+    except Exception as e:
+        return {'kind': kind, 'stem': Path(yaml_file).stem, 'error': str(e)}
+
+
+def content_outputs(facts):
+    """(content file, what generates it) pairs for an entity (see generate-content.py)."""
+    kind, stem = facts['kind'], facts['stem']
+    if kind == 'attributes':
+        return [(attribute_content_path(stem), 'attribute')]
+    if kind == 'views':
+        return [(view_content_path(stem), 'view')]
+    return [(object_content_path(stem), 'object')] + [
+        (perspective_content_path(stem, name), f"perspective '{name}'") for name in facts.get('perspectives', [])
+    ]
+
+
+class Index:
+    """Hash indexes over all entities, built in a single pass over the facts."""
+
+    def __init__(self, facts_by_path):
+        self.facts = facts_by_path
+        self.attributes_by_id = {}
+        self.attributes_by_name = {}
+        self.object_stems = set()
+        self.view_stems = set()
+        # Lowercased so case-only differences collide, as they do on macOS/Windows checkouts
+        self.sources_by_output = {}
+        self.referrers_by_object = {}
+        self.referrers_by_view = {}
+
+        for path, facts in facts_by_path.items():
+            kind = facts['kind']
+            if kind == 'attributes':
+                if facts.get('id'):
+                    self.attributes_by_id.setdefault(facts['id'], []).append(path)
+                if facts.get('name'):
+                    self.attributes_by_name.setdefault(normalize_name(facts['name']), []).append(path)
+            elif kind == 'objects':
+                self.object_stems.add(facts['stem'])
+                for target in facts.get('relationships', []):
+                    self.referrers_by_object.setdefault(target, set()).add(path)
+                for _, view_id in facts.get('views_used', []):
+                    self.referrers_by_view.setdefault(view_id, set()).add(path)
+            elif kind == 'views':
+                self.view_stems.add(facts['stem'])
+
+            if 'error' not in facts:
+                for output, label in content_outputs(facts):
+                    self.sources_by_output.setdefault(output.lower(), []).append((path, label))
+
+    def referrers(self, kind, stem):
+        if kind == 'objects':
+            return self.referrers_by_object.get(stem, set())
+        if kind == 'views':
+            return self.referrers_by_view.get(stem, set())
+        return set()
+
+
+def check_references(index, path, facts, objects=None, views=None):
+    """
+    Yield missing-object/missing-view issues of an object, optionally only for
+    references to the given object and view stems.
+    """
+    for target in facts.get('relationships', []):
+        if target not in index.object_stems and (objects is None or target in objects):
+            yield ERROR, 'missing-object', path, f"CoreRelationships references unknown object '{target}'"
+    for persp_name, view_id in facts.get('views_used', []):
+        if view_id not in index.view_stems and (views is None or view_id in views):
+            yield ERROR, 'missing-view', path, f"'{persp_name}' ViewsUsed references unknown view '{view_id}'"
+
+
+def check_entity(index, path, facts):
+    """Yield (level, code, path, message) for every constraint involving one entity."""
+    if 'error' in facts:
+        yield ERROR, 'parse-error', path, facts['error']
+        return
+
+    def others(paths):
+        return ', '.join(sorted(p for p in paths if p != path))
+
+    if facts['kind'] == 'attributes':
+        if not facts.get('id'):
+            yield WARNING, 'missing-id', path, "attribute has no id"
+        elif len(index.attributes_by_id[facts['id']]) > 1:
+            yield ERROR, 'duplicate-id', path, \
+                f"{facts['id']} also used by {others(index.attributes_by_id[facts['id']])}"
+
+        if facts.get('name'):
+            same_name = index.attributes_by_name[normalize_name(facts['name'])]
+            if len(same_name) > 1:
+                yield ERROR, 'duplicate-name', path, f"'{facts['name']}' also defined in {others(same_name)}"
+
+    if facts['kind'] == 'objects':
+        yield from check_references(index, path, facts)
+
+    for ref in facts.get('attribute_refs', []):
+        if ref and normalize_name(ref) not in index.attributes_by_name:
+            yield WARNING, 'undefined-attribute', path, f"attribute '{ref}' is not defined in data/attributes/"
+
+    reported = set()
+    for output, label in content_outputs(facts):
+        owners = index.sources_by_output[output.lower()]
+        if len(owners) > 1 and output.lower() not in reported:
+            reported.add(output.lower())
+            generators = ', '.join(f"{owner_label} in {owner_path}" for owner_path, owner_label in owners)
+            yield ERROR, 'output-collision', path, f"{output} is generated by {len(owners)} entries: {generators}"
+
+
+def run_checks(facts_by_path, touched=None):
+    """
+    Check all entities, or only `touched` paths plus the references to them.
+    Returns a list of (level, code, path, message).
+    """
+    index = Index(facts_by_path)
+
+    if touched is None:
+        return [issue for path in sorted(facts_by_path) for issue in check_entity(index, path, facts_by_path[path])]
+
+    targets = {path for path in touched if path in facts_by_path}
+    # Referrers are rechecked too, as deleting or renaming an object/view breaks them,
+    # but only for their references to the touched stems
+    touched_stems = {'objects': set(), 'views': set()}
+    referrers = set()
+    for path in touched:
+        kind, stem = Path(path).parent.name, Path(path).stem
+        if kind in touched_stems:
+            touched_stems[kind].add(stem)
+            referrers.update(index.referrers(kind, stem))
+
+    issues = []
+    for path in sorted(targets | referrers):
+        if path in targets:
+            issues.extend(check_entity(index, path, facts_by_path[path]))
+        elif 'error' not in facts_by_path[path]:
+            issues.extend(check_references(index, path, facts_by_path[path],
+                                           touched_stems['objects'], touched_stems['views']))
+    return issues
+
+
+def load_cache(cache_path):
+    if not cache_path.exists():
+        return None
+    with open(cache_path, 'r') as f:
+        try:
+            cache = json.load(f)
+        except ValueError:
+            return None
+    if cache.get('version') != CACHE_VERSION:
+        return None
+    return cache['files']
+
+
+def write_cache(cache_path, files):
+    # json.dumps uses the C encoder; json.dump to a file object does not
+    with open(cache_path, 'w') as f:
+        f.write(json.dumps({'version': CACHE_VERSION, 'files': files}, separators=(',', ':')))
+
+
+def scan(project_root, cached):
+    """Full scan: re-parse only files whose size/mtime changed since the cache was written."""
+    cached = cached or {}
+    files = {}
+    parsed = 0
+    for kind in KINDS:
+        directory = project_root / 'data' / kind
+        if not directory.exists():
+            continue
+        for yaml_file in directory.glob('*.yaml'):
+            path = yaml_file.relative_to(project_root).as_posix()
+            stat = yaml_file.stat()
+            entry = cached.get(path)
+            if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'facts': parse_facts(kind, yaml_file)}
+                parsed += 1
+            files[path] = entry
+    removed = len(set(cached) - set(files))
+    return files, parsed, removed
+
+
+def print_issues(issues, checked_label):
+    print("🩺 S4A Dictionary - Catalog Consistency Check")
+    print("━" * 60)
+    errors = [issue for issue in issues if issue[0] == ERROR]
+    warnings = [issue for issue in issues if issue[0] == WARNING]
+
+    for level, code, path, message in errors + warnings:
+        icon = "❌" if level == ERROR else "⚠️ "
+        print(f"{icon} [{code}] {path}: {message}")
+
+    print("━" * 60)
+    print(f"Checked {checked_label}: {len(errors)} errors, {len(warnings)} warnings")
+    return 1 if errors else 0
+
+
+def check(catalog=None):
+    """Full check from an already loaded catalog (used by 'dictionary.py check')."""
+    catalog = catalog or Catalog()
+    facts_by_path = {}
+    for kind in KINDS:
+        for yaml_file, data in catalog.entries(kind).items():
+            facts_by_path[yaml_file.relative_to(catalog.project_root).as_posix()] = extract_facts(kind, yaml_file, data)
+    # Files the catalog could not parse are reported like parse_facts() failures
+    for yaml_file, error in catalog.errors.items():
+        facts_by_path[yaml_file.relative_to(catalog.project_root).as_posix()] = \
+            {'kind': yaml_file.parent.name, 'stem': yaml_file.stem, 'error': error}
+    return print_issues(run_checks(facts_by_path), f"{len(facts_by_path)} files")
+
+
+def git_lines(command, project_root):
+    result = subprocess.run(['git', *command], cwd=project_root, capture_output=True, text=True, check=True)
+    return [line for line in result.stdout.splitlines() if line.strip()]
+
+
+def git_changed_files(args, project_root):
+    # --no-renames lists both sides of a rename, so referrers of the old name are rechecked
+    command = ['diff', '--name-only', '--no-renames']
+    command += ['--cached'] if args.staged else [args.since]
+    return git_lines(command, project_root)
+
+
+def use_staged_content(project_root, facts_by_path):
+    """
+    Make the facts describe the git index instead of the working tree, so a pre-commit
+    run checks what gets committed: files with unstaged changes (or deleted only from the
+    working tree) are re-read with 'git show :path', untracked files are dropped.
+    """
+    staged = set(git_lines(['ls-files', '--', 'data'], project_root))
+    unstaged = set(git_lines(['diff', '--name-only', '--no-renames', '--', 'data'], project_root))
+    for path in set(facts_by_path) - staged:
+        del facts_by_path[path]
+    for path in sorted(unstaged & staged):
+        kind = data_kind(path)
+        if kind:
+            text = subprocess.run(['git', 'show', f":{path}"], cwd=project_root,
+                                  capture_output=True, text=True, check=True).stdout
+            facts_by_path[path] = parse_facts(kind, project_root / path, text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check referential and uniqueness constraints of the catalog.")
+    parser.add_argument('files', nargs='*', help="Changed data files to recheck (default: check everything)")
+    parser.add_argument('--staged', action='store_true',
+                        help="Recheck files staged for commit, as staged (pre-commit hook)")
+    parser.add_argument('--since', metavar='REF', help="Recheck files changed since a git ref")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_FILE, help="Index cache file (default: %(default)s)")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    cache_path = project_root / args.cache
+    cached = load_cache(cache_path)
+
+    if args.staged or args.since:
+        changed = git_changed_files(args, project_root)
+    else:
+        changed = [Path(path).as_posix() for path in args.files]
+    incremental = bool(args.staged or args.since or args.files)
+
+    if incremental and not any(data_kind(path) for path in changed):
+        print("✅ No data files changed, nothing to check.")
+        return
+
+    # Always rescan: the index must reflect every file (e.g. a newly added object that
+    # is not in the changed list). Unchanged files cost one stat, not a parse.
+    files, parsed, removed = scan(project_root, cached)
+    # The changed list only selects which entities are reported
+    touched = [path for path in changed if data_kind(path)] if incremental else None
+
+    if parsed or removed or cached is None:
+        write_cache(cache_path, files)
+
+    facts_by_path = {path: entry['facts'] for path, entry in files.items()}
+    if args.staged:
+        use_staged_content(project_root, facts_by_path)
+    issues = run_checks(facts_by_path, touched)
+    label = f"{len(touched)} changed files" if touched is not None else f"{len(files)} files"
+    status = print_issues(issues, f"{label} ({parsed} parsed)")
+    sys.exit(status)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+
+"""
+S4A Business Dictionary - Dependency Graph
+Tracks which generated content files and Hugo pages depend on each YAML data file,
+and computes the minimal set to regenerate/rebuild for a list of changed files.
+
+Usage:
+  python3 scripts/dependency_graph.py --since origin/main   # compares against the data at origin/main
+  git diff --name-only HEAD~1 | python3 scripts/dependency_graph.py
+  python3 scripts/dependency_graph.py data/objects/FLIGHT.yaml --json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from catalog import Catalog, data_kind, normalize_name, parse_yaml, perspectives, references
+
+GRAPH_VERSION = 1
+DEFAULT_GRAPH_FILE = '.dependency-graph.json'
+
+# Changes under these paths affect how every page is rendered
+FULL_REBUILD_PREFIXES = ('layouts/', 'static/', 'archetypes/', 'hugo.yaml')
+
+# Changes to the generator (or the modules it loads data through) invalidate every generated content file
+GENERATOR_FILES = ('scripts/generate-content.py', 'scripts/generate-content.sh',
+                   'scripts/catalog.py', 'scripts/dependency_graph.py')
+
+# Pages rendered from the whole data set (index.json search payload, browse page)
+GLOBAL_PAGES = ('content/_index.md', 'content/browse/_index.md')
+
+
+def perspective_slug(perspective_name):
+    # Same slug rule as generate-content.py (e.g. "Route Management" -> "route-management")
+    return perspective_name.lower().replace(' ', '-')
+
+
+def object_content_path(object_id):
+    return f"content/objects/{object_id.lower()}.md"
+
+
+def perspective_content_path(object_id, perspective_name):
+    return f"content/perspectives/{object_id.lower()}-{perspective_slug(perspective_name)}.md"
+
+
+def view_content_path(view_id):
+    return f"content/views/{view_id}.md"
+
+
+def attribute_content_path(attribute_stem):
+    return f"content/attributes/{attribute_stem}.md"
+
+
+def section_index_path(content_path):
+    """content/objects/flight.md -> content/objects/_index.md"""
+    return str(Path(content_path).parent / '_index.md')
+
+
+def build_graph(catalog):
+    """
+    Build the dependency graph for the data files in a Catalog.
+
+    Returns a dict mapping each source YAML (path relative to project root) to
+    {'outputs': [...generated content files...], 'pages': [...content pages to rebuild...]}.
+    """
+    def rel(path):
+        return path.relative_to(catalog.project_root).as_posix()
+
+    graph = {}
+
+    def add(source, outputs=(), pages=()):
+        entry = graph.setdefault(source, {'outputs': set(), 'pages': set()})
+        entry['outputs'].update(outputs)
+        entry['pages'].update(outputs)
+        entry['pages'].update(pages)
+
+    attributes = list(catalog.items('attributes'))
+    objects = list(catalog.items('objects'))
+    views = list(catalog.items('views'))
+
+    # Attribute name -> attribute page(s), as resolved by the templates via lower(name)
+    attribute_pages_by_name = {}
+    attribute_source_by_page = {}
+    for yaml_file, data in attributes:
+        page = attribute_content_path(yaml_file.stem)
+        attribute_source_by_page[page] = rel(yaml_file)
+        names = {normalize_name(yaml_file.stem)}
+        if data.get('name'):
+            names.add(normalize_name(data['name']))
+        for name in names:
+            attribute_pages_by_name.setdefault(name, set()).add(page)
+        add(rel(yaml_file), outputs=[page])
+
+    # Pages that reference an attribute name (object, perspective and view pages)
+    referencing_pages_by_name = {}
+
+    def reference(name, page):
+        referencing_pages_by_name.setdefault(normalize_name(name), set()).add(page)
+
+    # View id -> perspective pages listing it in ViewsUsed
+    perspective_pages_by_view = {}
+    # Object id -> object pages whose ER diagram reads it via CoreRelationships
+    object_pages_by_related = {}
+
+    for yaml_file, data in objects:
+        object_id = yaml_file.stem
+        object_page = object_content_path(object_id)
+        outputs = [object_page] + [perspective_content_path(object_id, name) for name, _ in perspectives(data)]
+        pages = set()
+
+        for rel_data in data.get('CoreRelationships') or []:
+            related = rel_data.get('object')
+            if related:
+                object_pages_by_related.setdefault(str(related), set()).add(object_page)
+
+        for target, persp_name, name in references('objects', data):
+            page = object_page if persp_name is None else perspective_content_path(object_id, persp_name)
+            if target == 'view':
+                perspective_pages_by_view.setdefault(name, set()).add(page)
+            else:
+                reference(name, page)
+                pages.update(attribute_pages_by_name.get(normalize_name(name), ()))
+
+        add(rel(yaml_file), outputs=outputs, pages=pages)
+
+    for yaml_file, data in views:
+        view_id = yaml_file.stem
+        view_page = view_content_path(view_id)
+        pages = set(perspective_pages_by_view.get(view_id, ()))
+
+        for _, _, name in references('views', data):
+            reference(name, view_page)
+            pages.update(attribute_pages_by_name.get(normalize_name(name), ()))
+
+        add(rel(yaml_file), outputs=[view_page], pages=pages)
+
+    # Reverse edges: pages that render data from another source
+    for yaml_file, data in objects:
+        add(rel(yaml_file), pages=object_pages_by_related.get(yaml_file.stem, ()))
+
+    for name, pages in attribute_pages_by_name.items():
+        for page in pages:
+            add(attribute_source_by_page[page], pages=referencing_pages_by_name.get(name, ()))
+
+    return {
+        source: {'outputs': sorted(entry['outputs']), 'pages': sorted(entry['pages'])}
+        for source, entry in sorted(graph.items())
+    }
+
+
+def load_graph(graph_path):
+    """Load a previously recorded graph, or an empty one if missing/outdated."""
+    graph_path = Path(graph_path)
+    if not graph_path.exists():
+        return {}
+    with open(graph_path, 'r') as f:
+        try:
+            recorded = json.load(f)
+        except ValueError:
+            return {}
+    if recorded.get('version') != GRAPH_VERSION:
+        return {}
+    return recorded.get('sources', {})
+
+
+def write_graph(graph, graph_path):
+    with open(graph_path, 'w') as f:
+        json.dump({'version': GRAPH_VERSION, 'sources': graph}, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def affected(changed_files, current, previous=()):
+    """
+    Compute the invalidation set for changed files.
+
+    `current` is the graph of the data as it is now. `previous` graphs describe the
+    data before the change (the base revision, or the recorded graph), so references
+    from deleted or renamed files are still found. Outputs that no current source
+    generates any more are reported under 'delete' instead of 'outputs'.
+    """
+    graphs = [*previous, current]
+    outputs = set()
+    pages = set()
+    full_rebuild = False
+    regenerate_all = False
+
+    for path in changed_files:
+        path = Path(path).as_posix()
+
+        if path.startswith(FULL_REBUILD_PREFIXES):
+            full_rebuild = True
+            continue
+
+        if path in GENERATOR_FILES:
+            regenerate_all = True
+            continue
+
+        if path.startswith('data/'):
+            for graph in graphs:
+                entry = graph.get(path)
+                if entry:
+                    outputs.update(entry['outputs'])
+                    pages.update(entry['pages'])
+            continue
+
+        if path.startswith('content/') and path.endswith('.md'):
+            pages.add(path)
+
+    if regenerate_all:
+        for graph in graphs:
+            for entry in graph.values():
+                outputs.update(entry['outputs'])
+                pages.update(entry['pages'])
+
+    current_outputs = {output for entry in current.values() for output in entry['outputs']}
+    delete = outputs - current_outputs
+    outputs -= delete
+    pages -= delete
+
+    if pages or delete:
+        pages.update(section_index_path(page) for page in pages | delete)
+        pages.update(GLOBAL_PAGES)
+
+    return {
+        'full_rebuild': full_rebuild,
+        'outputs': sorted(outputs),
+        'delete': sorted(delete),
+        'pages': sorted(pages),
+        'sources': sorted(source for source, entry in current.items() if set(entry['outputs']) & outputs),
+    }
+
+
+def git_changed_files(ref, project_root):
+    # --no-renames lists both sides of a rename, so the old path is invalidated too
+    result = subprocess.run(
+        ['git', 'diff', '--name-only', '--no-renames', ref],
+        cwd=project_root, capture_output=True, text=True, check=True
+    )
+    return [line for line in result.stdout.splitlines() if line.strip()]
+
+
+def catalog_at(ref, changed_files, catalog):
+    """
+    The catalog as of a git revision: changed data files are read with 'git show REF:path',
+    all others are shared with the current catalog (they are identical at `ref`).
+    """
+    changes = {}
+    for path in changed_files:
+        if not data_kind(path):
+            continue
+        result = subprocess.run(['git', 'show', f"{ref}:./{path}"],
+                                cwd=catalog.project_root, capture_output=True, text=True)
+        try:
+            # Files added since `ref` (or unparsable there) did not contribute to the old pages
+            changes[path] = parse_yaml(result.stdout) if result.returncode == 0 else None
+        except Exception:
+            changes[path] = None
+    return catalog.overlay(changes)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute generated files and pages affected by changed files."
+    )
+    parser.add_argument('files', nargs='*', help="Changed files, relative to project root (default: read stdin)")
+    parser.add_argument('--since', metavar='REF', help="Use 'git diff --name-only REF' as the changed files")
+    parser.add_argument('--graph', default=DEFAULT_GRAPH_FILE, help="Recorded graph file (default: %(default)s)")
+    parser.add_argument('--record', action='store_true', help="Record the current graph and exit")
+    parser.add_argument('--json', action='store_true', help="Print the result as JSON")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    graph_path = project_root / args.graph
+    catalog = Catalog(project_root)
+    current = build_graph(catalog)
+
+    if args.record:
+        write_graph(current, graph_path)
+        print(f"✅ Recorded dependency graph for {len(current)} sources in {args.graph}")
+        return
+
+    if args.since:
+        changed = git_changed_files(args.since, project_root)
+        # The recorded graph is not available in a fresh checkout; rebuild the base revision's graph
+        previous = build_graph(catalog_at(args.since, changed, catalog))
+    else:
+        if args.files:
+            changed = args.files
+        else:
+            changed = [line.strip() for line in sys.stdin if line.strip()]
+        previous = load_graph(graph_path)
+
+    result = affected(changed, current, [previous])
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print("🧭 S4A Dictionary - Affected Outputs")
+    print("━" * 60)
+    print(f"Changed files: {len(changed)}")
+    if result['full_rebuild']:
+        print("⚠️  Templates or site config changed: full Hugo rebuild required.")
+
+    print(f"\n🔁 Sources to regenerate ({len(result['sources'])}):")
+    for source in result['sources']:
+        print(f"  • {source}")
+
+    print(f"\n📝 Generated content files ({len(result['outputs'])}):")
+    for output in result['outputs']:
+        print(f"  • {output}")
+
+    print(f"\n🗑️  Stale content files to delete ({len(result['delete'])}):")
+    for output in result['delete']:
+        print(f"  • {output}")
+
+    print(f"\n🌐 Pages to rebuild ({len(result['pages'])}):")
+    for page in result['pages']:
+        print(f"  • {page}")
+    print("━" * 60)
+
+
+if __name__ == '__main__':
+    main()
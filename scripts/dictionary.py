@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""
+S4A Business Dictionary - CLI
+Runs one or more dictionary scripts in a single process, sharing one loaded catalog.
+Only the modules needed by the chosen subcommands are imported.
+
+Usage:
+  python3 scripts/dictionary.py generate
+  python3 scripts/dictionary.py scaffold populate generate
+"""
+
+import time
+
+# Taken once the interpreter is up: the "cli overhead" timing covers this script's own
+# imports and setup, not interpreter startup (see 'python3 -X importtime' for that)
+START = time.perf_counter()
+
+import sys
+
+# Subcommand -> (module, function, description); modules are imported on first use
+COMMANDS = {
+    'analyze': ('analyze_missing_attributes', 'main', "Report attributes used but not defined"),
+    'scaffold': ('scaffold_missing_attributes', 'main', "Create draft files for missing attributes"),
+    'populate': ('populate_attributes', 'main', "Fill auto-generated attributes with sample data"),
+    'generate': ('generate-content', 'main', "Generate Hugo content files from YAML data"),
+    'snapshot': ('catalog_snapshot', 'build', "Write the binary catalog snapshot"),
+    'check': ('check_catalog', 'check', "Check referential and uniqueness constraints"),
+}
+
+
+def usage():
+    print("Usage: python3 scripts/dictionary.py COMMAND [COMMAND ...]")
+    print("\nCommands (run in the given order, sharing one loaded catalog):")
+    for name, (_, _, description) in COMMANDS.items():
+        print(f"  {name:<10} {description}")
+
+
+def main(argv):
+    if not argv or any(arg in ('-h', '--help') for arg in argv):
+        usage()
+        return 0
+
+    unknown = [arg for arg in argv if arg not in COMMANDS]
+    if unknown:
+        print(f"❌ Unknown command: {', '.join(unknown)}", file=sys.stderr)
+        usage()
+        return 2
+
+    import importlib
+    from catalog import Catalog
+
+    catalog = Catalog()
+    overhead_time = time.perf_counter() - START
+    timings = []
+    status = 0
+
+    for name in argv:
+        start = time.perf_counter()
+        load_before = catalog.load_time
+        try:
+            module_name, function, _ = COMMANDS[name]
+            result = getattr(importlib.import_module(module_name), function)(catalog=catalog)
+            # A command returns a non-zero int status (e.g. check errors) to fail the run
+            if isinstance(result, int) and result:
+                status = result
+        except Exception as e:
+            print(f"\n❌ Error in '{name}': {e}", file=sys.stderr)
+            return 1
+        # Work time excludes catalog loading triggered by this command
+        elapsed = time.perf_counter() - start - (catalog.load_time - load_before)
+        timings.append((name, elapsed))
+        print()
+
+    print("⏱️  Timings")
+    print("━" * 60)
+    print(f"   • {'cli overhead':<12} {overhead_time * 1000:8.1f} ms")
+    print(f"   • {'catalog load':<12} {catalog.load_time * 1000:8.1f} ms")
+    for name, elapsed in timings:
+        print(f"   • {name:<12} {elapsed * 1000:8.1f} ms")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -3,23 +3,62 @@
 """
 S4A Business Dictionary - Content Generator
 Automatically generates Hugo content files (.md) from YAML data files
-Usage: python3 scripts/generate-content.py
+Usage: python3 scripts/generate-content.py [data/objects/FLIGHT.yaml ...]
+
+When data files are given, only the content generated from them is rewritten
+(see scripts/dependency_graph.py to compute them from a git diff).
 """
 
 import os
-import yaml
 import sys
 from pathlib import Path
 
-def main():
+from catalog import KINDS, Catalog, data_kind
+
+def record_dependency_graph(catalog):
+    """Record which pages depend on which data files for partial rebuilds."""
+    # Imported here: dependency_graph pulls in argparse/json/subprocess, which generating content does not need
+    import dependency_graph
+
+    graph = dependency_graph.build_graph(catalog)
+    dependency_graph.write_graph(graph, dependency_graph.DEFAULT_GRAPH_FILE)
+    print(f"\n🧭 Recorded dependency graph: {dependency_graph.DEFAULT_GRAPH_FILE}")
+
+def selected_paths(args, project_root):
+    """Resolve data file arguments (absolute or relative to the cwd) to paths relative to the project root."""
+    paths = set()
+    for arg in args:
+        path = Path(arg).resolve()
+        try:
+            path = path.relative_to(project_root.resolve()).as_posix()
+        except ValueError:
+            raise ValueError(f"{arg} is outside the project ({project_root})")
+        if not data_kind(path):
+            raise ValueError(f"{arg} is not a data file (expected data/{{attributes,objects,views}}/*.yaml)")
+        paths.add(path)
+    return paths
+
+def main(only=None, catalog=None):
     print("🚀 S4A Dictionary Content Generator")
     print("━" * 80)
     
-    # Get project root (parent of scripts directory)
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
+    catalog = catalog or Catalog()
+    project_root = catalog.project_root
     
     os.chdir(project_root)
+
+    # A malformed data file fails the run instead of silently dropping its pages
+    for kind in KINDS:
+        catalog.entries(kind)
+    for yaml_file, error in catalog.errors.items():
+        if only is None or yaml_file.relative_to(project_root).as_posix() in only:
+            raise ValueError(f"Cannot parse {yaml_file.relative_to(project_root)}: {error}")
+
+    def selected(kind):
+        # Data files of a kind, restricted to `only` (paths relative to project root) if given
+        for yaml_file, data in catalog.items(kind):
+            if only is None or yaml_file.relative_to(project_root).as_posix() in only:
+                yield yaml_file, data
     
     counters = {
         'objects': 0,
@@ -32,7 +71,6 @@ def main():
     print("\n🏷️  Generating Attribute content files...")
     print("━" * 80)
     
-    attributes_dir = Path('data/attributes')
     content_attributes_dir = Path('content/attributes')
     content_attributes_dir.mkdir(parents=True, exist_ok=True)
     
@@ -91,9 +129,7 @@ def main():
             'refresh': 'Daily'
         }
 
-    for yaml_file in attributes_dir.glob('*.yaml'):
-        with open(yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
+    for yaml_file, data in selected('attributes'):
         
         attr_id = data.get('id', '')
         attr_name = data.get('name', yaml_file.stem)
@@ -125,13 +161,10 @@ refreshRate: "{origin['refresh']}"
     print("\n📦 Generating Object content files...")
     print("━" * 80)
     
-    objects_dir = Path('data/objects')
     content_objects_dir = Path('content/objects')
     content_objects_dir.mkdir(parents=True, exist_ok=True)
     
-    for yaml_file in objects_dir.glob('*.yaml'):
-        with open(yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
+    for yaml_file, data in selected('objects'):
         
         object_id = yaml_file.stem
         object_slug = object_id.lower()
@@ -153,13 +186,10 @@ description: "Definition of the {object_name} business object."
     print("\n🖼️  Generating View content files...")
     print("━" * 80)
     
-    views_dir = Path('data/views')
     content_views_dir = Path('content/views')
     content_views_dir.mkdir(parents=True, exist_ok=True)
     
-    for yaml_file in views_dir.glob('*.yaml'):
-        with open(yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
+    for yaml_file, data in selected('views'):
         
         view_id = yaml_file.stem
         view_description = data.get('Description', '')
@@ -186,9 +216,7 @@ description: "{view_description}"
     content_perspectives_dir = Path('content/perspectives')
     content_perspectives_dir.mkdir(parents=True, exist_ok=True)
     
-    for yaml_file in objects_dir.glob('*.yaml'):
-        with open(yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
+    for yaml_file, data in selected('objects'):
         
         object_id = yaml_file.stem
         object_slug = object_id.lower()
@@ -215,6 +243,8 @@ perspective_id: "{perspective_name}"
             print(f"  ✅ Generated: {content_file} ({object_id} -> {perspective_name})")
             counters['perspectives'] += 1
     
+    record_dependency_graph(catalog)
+
     # Summary
     print("\n" + "━" * 80)
     print("✨ Content generation complete!")
@@ -232,7 +262,7 @@ perspective_id: "{perspective_name}"
 
 if __name__ == '__main__':
     try:
-        main()
+        main(selected_paths(sys.argv[1:], Path(__file__).parent.parent) or None)
     except Exception as e:
         print(f"\n❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+
+"""
+S4A Business Dictionary - Bulk Attribute Importer
+Imports attribute definitions from large CSV/JSONL metadata exports
+(e.g. Amadeus DCS, AODB, SAP ERP) into data/attributes/.
+
+Usage:
+  python3 scripts/import_attributes.py export.csv --source "Amadeus DCS"
+  python3 scripts/import_attributes.py export.jsonl --dry-run
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import re
+import time
+import yaml
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from catalog import Catalog, normalize_name, to_kebab_case, yaml_dumper
+
+# Export column (lowercased, without spaces/underscores) -> attribute field
+FIELD_MAP = {
+    'name': 'name',
+    'attributename': 'name',
+    'fieldname': 'name',
+    'description': 'description',
+    'datatype': 'dataType',
+    'type': 'dataType',
+    'unit': 'unit',
+    'format': 'format',
+    'pattern': 'format',
+    'minlength': 'minLength',
+    'maxlength': 'maxLength',
+    'minvalue': 'minValue',
+    'maxvalue': 'maxValue',
+    'example': 'example',
+}
+
+INTEGER_FIELDS = ('minLength', 'maxLength')
+NUMBER_FIELDS = ('minValue', 'maxValue')
+
+DATA_TYPES = {
+    'String', 'Enum', 'Integer', 'Decimal', 'Boolean', 'Date', 'DateTime',
+    'Duration', 'Distance', 'GeoPoint', 'Currency', 'List',
+}
+# Case-insensitive lookup (e.g. "datetime" -> "DateTime")
+DATA_TYPES_BY_LOWER = {t.lower(): t for t in DATA_TYPES}
+
+YAML_DUMPER = yaml_dumper()
+
+MAX_REPORTED_ERRORS = 10
+
+
+def read_rows(path):
+    """Stream rows from a CSV or JSONL export without loading it into memory."""
+    path = Path(path)
+    # utf-8-sig strips the BOM that Excel/SAP exports start with
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        if path.suffix.lower() in ('.jsonl', '.ndjson'):
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    yield {'__error__': f"line {line_no}: invalid JSON ({e})"}
+                    continue
+                if isinstance(row, dict):
+                    yield row
+                else:
+                    yield {'__error__': f"line {line_no}: expected a JSON object, got {type(row).__name__}"}
+        else:
+            yield from csv.DictReader(f)
+
+
+def batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def map_row(row):
+    """Map export columns to attribute fields. Returns (fields, error)."""
+    if '__error__' in row:
+        return None, row['__error__']
+
+    fields = {}
+    for column, value in row.items():
+        if column is None or value is None or value == '':
+            continue
+        key = FIELD_MAP.get(re.sub(r'[\s_-]+', '', str(column)).lower())
+        if key and key not in fields:
+            fields[key] = value.strip() if isinstance(value, str) else value
+
+    if not fields.get('name'):
+        return None, "missing name"
+
+    data_type = str(fields.get('dataType', 'String'))
+    if data_type.lower() not in DATA_TYPES_BY_LOWER:
+        return None, f"unknown dataType '{data_type}' for '{fields['name']}'"
+    fields['dataType'] = DATA_TYPES_BY_LOWER[data_type.lower()]
+
+    try:
+        for key in INTEGER_FIELDS:
+            if key in fields:
+                fields[key] = int(fields[key])
+        for key in NUMBER_FIELDS:
+            if key in fields:
+                fields[key] = float(fields[key])
+    except (TypeError, ValueError):
+        return None, f"invalid numeric constraint for '{fields['name']}'"
+
+    return fields, None
+
+
+def load_existing(catalog):
+    """Collect normalized names, IDs and filenames of existing attribute definitions."""
+    names, ids = set(), set()
+    for _, data in catalog.items('attributes'):
+        if 'name' in data:
+            names.add(normalize_name(data['name']))
+        if 'id' in data:
+            ids.add(data['id'])
+    # Unparsable files still occupy their filename.
+    # Compare case-insensitively: filenames must also be unique on macOS/Windows
+    attributes_dir = catalog.data_dir('attributes')
+    filenames = {yaml_file.stem.lower() for yaml_file in catalog.entries('attributes')}
+    filenames.update(yaml_file.stem.lower() for yaml_file in catalog.errors if yaml_file.parent == attributes_dir)
+    return names, ids, filenames
+
+
+def write_attribute(file_path, data):
+    with open(file_path, 'w') as f:
+        yaml.dump(data, f, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
+
+
+class Importer:
+    def __init__(self, catalog, source, dry_run=False):
+        self.attributes_dir = catalog.data_dir('attributes')
+        self.source = source
+        self.dry_run = dry_run
+        self.names, self.ids, self.filenames = load_existing(catalog)
+        self.next_id_num = 100
+        self.stats = {'rows': 0, 'imported': 0, 'duplicates': 0, 'invalid': 0}
+        self.errors = []
+
+    def next_id(self):
+        while f"ATTR-{self.next_id_num:03d}" in self.ids:
+            self.next_id_num += 1
+        new_id = f"ATTR-{self.next_id_num:03d}"
+        self.ids.add(new_id)
+        return new_id
+
+    def unique_filename(self, name):
+        base = to_kebab_case(name) or 'attribute'
+        stem, suffix = base, 2
+        while stem in self.filenames:
+            stem = f"{base}-{suffix}"
+            suffix += 1
+        self.filenames.add(stem)
+        return f"{stem}.yaml"
+
+    def prepare(self, batch):
+        """Validate and dedupe a batch; returns the (path, data) pairs to write."""
+        pending = []
+        for row in batch:
+            self.stats['rows'] += 1
+            fields, error = map_row(row)
+            if error:
+                self.stats['invalid'] += 1
+                if len(self.errors) < MAX_REPORTED_ERRORS:
+                    self.errors.append(error)
+                continue
+
+            norm_name = normalize_name(fields['name'])
+            if norm_name in self.names:
+                self.stats['duplicates'] += 1
+                continue
+            self.names.add(norm_name)
+
+            data = {
+                'id': self.next_id(),
+                'name': fields.pop('name'),
+                'description': fields.pop('description', None),
+                'dataType': fields.pop('dataType'),
+                'source': self.source,
+                'status': 'draft',
+            }
+            if not data['description']:
+                data['description'] = f"Attribute representing {data['name']}."
+            data.update(fields)
+
+            pending.append((self.attributes_dir / self.unique_filename(data['name']), data))
+        return pending
+
+    async def run(self, rows, batch_size, workers):
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch in batched(rows, batch_size):
+                pending = self.prepare(batch)
+                if not self.dry_run:
+                    await asyncio.gather(*(
+                        loop.run_in_executor(executor, write_attribute, path, data)
+                        for path, data in pending
+                    ))
+                self.stats['imported'] += len(pending)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import attribute definitions from CSV/JSONL exports.")
+    parser.add_argument('export', help="CSV or JSONL (.jsonl/.ndjson) export file")
+    parser.add_argument('--source', default='Bulk Import', help="Value for the 'source' field (e.g. the exporting system)")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Rows validated and written per batch")
+    parser.add_argument('--workers', type=int, default=8, help="Threads used for file writes")
+    parser.add_argument('--dry-run', action='store_true', help="Validate and dedupe without writing files")
+    args = parser.parse_args()
+
+    print("📥 S4A Dictionary - Bulk Attribute Import")
+    print("━" * 60)
+
+    catalog = Catalog()
+    catalog.data_dir('attributes').mkdir(exist_ok=True)
+
+    start = time.perf_counter()
+    importer = Importer(catalog, args.source, dry_run=args.dry_run)
+    load_time = time.perf_counter() - start
+    print(f"✅ Found {len(importer.names)} existing attribute definitions ({load_time:.2f}s).")
+
+    start = time.perf_counter()
+    asyncio.run(importer.run(read_rows(args.export), args.batch_size, args.workers))
+    elapsed = time.perf_counter() - start
+
+    stats = importer.stats
+    for error in importer.errors:
+        print(f"⚠️  Skipped row: {error}")
+    if stats['invalid'] > len(importer.errors):
+        print(f"⚠️  ... {stats['invalid'] - len(importer.errors)} more invalid rows")
+
+    print("━" * 60)
+    action = "Would import" if args.dry_run else "Imported"
+    rate = stats['rows'] / elapsed if elapsed else 0
+    print(f"🎉 {action} {stats['imported']} new attributes from {stats['rows']} rows.")
+    print(f"   • Duplicates skipped: {stats['duplicates']}")
+    print(f"   • Invalid rows:       {stats['invalid']}")
+    print(f"   • Import time:        {elapsed:.2f}s ({rate:.0f} rows/s)")
+
+if __name__ == '__main__':
+    main()
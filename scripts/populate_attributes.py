@@ -1,15 +1,12 @@
 #!/usr/bin/env python3
 
-import os
-import yaml
-from pathlib import Path
+from catalog import Catalog
 
-def main():
+def main(catalog=None):
     print("🎨 S4A Dictionary - Populating Attributes with Sample Data")
     print("━" * 60)
     
-    project_root = Path(__file__).parent.parent
-    attributes_dir = project_root / 'data/attributes'
+    catalog = catalog or Catalog()
     
     # Define rules for populating data based on attribute name keywords
     # Priority: Exact match > Keyword match
@@ -273,15 +270,8 @@ def main():
 
     updated_count = 0
     
-    for yaml_file in attributes_dir.glob('*.yaml'):
-        with open(yaml_file, 'r') as f:
-            try:
-                data = yaml.safe_load(f)
-            except:
-                continue
-        
-        if not data: continue
-        
+    # Snapshot: files are rewritten (and re-cached) while iterating
+    for yaml_file, data in list(catalog.items('attributes')):
         # Only update files marked as Auto-generated or Draft with minimal info
         if data.get('source') != 'Auto-generated':
             continue
@@ -313,8 +303,7 @@ def main():
             new_data['id'] = data['id']
             new_data['name'] = original_name
             
-            with open(yaml_file, 'w') as f:
-                yaml.dump(new_data, f, sort_keys=False)
+            catalog.write('attributes', yaml_file, new_data)
             
             print(f"✅ Updated {yaml_file.name}")
             updated_count += 1
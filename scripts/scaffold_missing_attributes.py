@@ -1,79 +1,33 @@
 #!/usr/bin/env python3
 
-import os
-import yaml
-from pathlib import Path
-import re
+from catalog import Catalog, normalize_name, references, to_kebab_case
 
-def normalize_name(name):
-    return str(name).strip().lower()
-
-def to_kebab_case(name):
-    name = str(name).strip().lower()
-    name = re.sub(r'[^a-z0-9]+', '-', name)
-    return name.strip('-')
-
-def main():
+def main(catalog=None):
     print("🛠️  S4A Dictionary - Scaffolding Missing Attributes")
     print("━" * 60)
     
-    project_root = Path(__file__).parent.parent
-    attributes_dir = project_root / 'data/attributes'
+    catalog = catalog or Catalog()
+    attributes_dir = catalog.data_dir('attributes')
     attributes_dir.mkdir(exist_ok=True)
 
     # 1. Load existing attributes
     existing_attributes = set()
     existing_ids = set()
     
-    for yaml_file in attributes_dir.glob('*.yaml'):
-        with open(yaml_file, 'r') as f:
-            try:
-                data = yaml.safe_load(f)
-                if data:
-                    if 'name' in data:
-                        existing_attributes.add(normalize_name(data['name']))
-                    if 'id' in data:
-                        existing_ids.add(data['id'])
-            except:
-                pass
+    for yaml_file, data in catalog.items('attributes'):
+        if 'name' in data:
+            existing_attributes.add(normalize_name(data['name']))
+        if 'id' in data:
+            existing_ids.add(data['id'])
 
     # 2. Scan for used attributes
     used_attributes = set()
 
-    # Scan Objects
-    objects_dir = project_root / 'data/objects'
-    if objects_dir.exists():
-        for yaml_file in objects_dir.glob('*.yaml'):
-            with open(yaml_file, 'r') as f:
-                try:
-                    data = yaml.safe_load(f)
-                    if not data: continue
-                    
-                    if 'CoreAttributes' in data and data['CoreAttributes']:
-                        for attr in data['CoreAttributes']:
-                            if 'Name' in attr: used_attributes.add(attr['Name'])
-
-                    if 'SystemPerspectives' in data and data['SystemPerspectives']:
-                        for persp_data in data['SystemPerspectives'].values():
-                            if 'RelevantAttributes' in persp_data and persp_data['RelevantAttributes']:
-                                for attr in persp_data['RelevantAttributes']:
-                                    if 'Name' in attr: used_attributes.add(attr['Name'])
-                except: pass
-
-    # Scan Views
-    views_dir = project_root / 'data/views'
-    if views_dir.exists():
-        for yaml_file in views_dir.glob('*.yaml'):
-            with open(yaml_file, 'r') as f:
-                try:
-                    data = yaml.safe_load(f)
-                    if not data: continue
-                    
-                    if 'IncludedAttributes' in data and data['IncludedAttributes']:
-                        for attr in data['IncludedAttributes']:
-                            if isinstance(attr, dict): used_attributes.add(attr.get('Name', ''))
-                            else: used_attributes.add(str(attr))
-                except: pass
+    # Scan Objects and Views
+    for kind in ('objects', 'views'):
+        for yaml_file, data in catalog.items(kind):
+            for target, _, name in references(kind, data):
+                if target == 'attribute': used_attributes.add(name)
 
     # 3. Create missing files
     created_count = 0
@@ -105,8 +59,7 @@ def main():
             'status': 'draft'
         }
         
-        with open(file_path, 'w') as f:
-            yaml.dump(data, f, sort_keys=False)
+        catalog.write('attributes', file_path, data)
             
         print(f"✅ Created {file_name} ({new_id})")
         created_count += 1
@@ -1,4 +1,4 @@
-document.addEventListener('DOMContentLoaded', async function () {
+document.addEventListener('DOMContentLoaded', function () {
     // Support both home page search and navbar search
     const homeSearchInput = document.getElementById('search-input');
     const homeSearchResults = document.getElementById('search-results');
@@ -10,21 +10,63 @@ document.addEventListener('DOMContentLoaded', async function () {
     // Exit if no search inputs found
     if (!homeSearchInput && !navbarSearchInput) return;
 
-    let searchIndex = [];
+    const MAX_RESULTS = 10;
 
-    // Load search index
-    try {
-        const baseUrl = window.baseURL || '/';
-        const cleanBaseUrl = baseUrl.endsWith('/') ? baseUrl : baseUrl + '/';
-        const response = await fetch(cleanBaseUrl + 'index.json');
+    const baseUrl = window.baseURL || '/';
+    const cleanBaseUrl = baseUrl.endsWith('/') ? baseUrl : baseUrl + '/';
+
+    async function fetchJson(url) {
+        const response = await fetch(url);
 
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
 
-        searchIndex = await response.json();
-    } catch (error) {
-        console.error('Error loading search index:', error);
+        return response.json();
+    }
+
+    // Split per-section payloads written by scripts/build_search_index.py
+    async function loadSection(manifest, section) {
+        const field = Object.fromEntries(manifest.fields.map((name, i) => [name, i]));
+        const payload = await fetchJson(cleanBaseUrl + 'search/' + manifest.sections[section].file);
+        return payload.entries.map(row => ({
+            title: row[field.title],
+            permalink: row[field.permalink],
+            section: section,
+            category: manifest.categories[row[field.category]],
+            status: manifest.statuses[row[field.status]],
+            content: row[field.content],
+            key: row[field.key]
+        }));
+    }
+
+    // Fallback: full Hugo index.json (e.g. when the post-build step was not run)
+    async function loadFullIndex() {
+        const entries = await fetchJson(cleanBaseUrl + 'index.json');
+        return entries.map(item => ({
+            ...item,
+            key: [item.title, item.section, item.category, item.content, item.status].join(' ').toLowerCase()
+        }));
+    }
+
+    // The manifest is fetched on first use (focus or typing), not on every page view.
+    // Resolves to a list of loaders, one per section, each fetching its file once.
+    let sourcesPromise = null;
+    function ensureSources() {
+        if (!sourcesPromise) {
+            const once = load => {
+                let promise = null;
+                return () => promise || (promise = load().catch(error => {
+                    console.error('Error loading search index:', error);
+                    promise = null;
+                    return [];
+                }));
+            };
+            sourcesPromise = fetchJson(cleanBaseUrl + 'search/manifest.json')
+                .then(manifest => Object.keys(manifest.sections).map(section => once(() => loadSection(manifest, section))))
+                .catch(() => [once(loadFullIndex)]);
+        }
+        return sourcesPromise;
     }
 
     // Get icon and color for category
@@ -38,27 +80,34 @@ document.addEventListener('DOMContentLoaded', async function () {
         return icons[category] || 'file-text';
     }
 
-    // Search function
-    function performSearch(query, resultsContainer, resultsList) {
+    // Search function: sections are fetched one at a time, only until enough results are found,
+    // and the results are shown as each section arrives
+    async function performSearch(query, resultsContainer, resultsList) {
+        resultsContainer.dataset.query = query;
         if (!query.trim()) {
             resultsContainer.style.display = 'none';
             if (resultsList) resultsList.innerHTML = '';
             return;
         }
 
-        const lowercaseQuery = query.toLowerCase();
-        const results = searchIndex.filter(item => {
-            const searchableContent = [
-                item.title,
-                item.section,
-                item.category,
-                item.content,
-                item.status
-            ].join(' ').toLowerCase();
-
-            return searchableContent.includes(lowercaseQuery);
-        }).slice(0, 10); // Limit to 10 results
+        // Every query term must appear in the precomputed lowercase key
+        const terms = query.toLowerCase().split(/\s+/).filter(Boolean);
+        const results = [];
+        const sources = await ensureSources();
+        for (let i = 0; i < sources.length && results.length < MAX_RESULTS; i++) {
+            const entries = await sources[i]();
+            // A newer query was typed while this section was loading
+            if (resultsContainer.dataset.query !== query) return;
+
+            results.push(...entries.filter(item => terms.every(term => item.key.includes(term))));
+            const done = results.length >= MAX_RESULTS || i === sources.length - 1;
+            if (results.length > 0 || done) {
+                renderResults(results.slice(0, MAX_RESULTS), resultsContainer, resultsList);
+            }
+        }
+    }
 
+    function renderResults(results, resultsContainer, resultsList) {
         const resultsHTML = results.length === 0
             ? '<div class="uk-text-center uk-text-muted uk-padding-small">No results found</div>'
             : results.map(item => `
@@ -120,6 +169,7 @@ document.addEventListener('DOMContentLoaded', async function () {
     // Setup home page search
     if (homeSearchInput && homeSearchResults && homeResultsList) {
         let searchTimeout;
+        homeSearchInput.addEventListener('focus', ensureSources);
         homeSearchInput.addEventListener('input', (e) => {
             clearTimeout(searchTimeout);
             searchTimeout = setTimeout(() => {
@@ -131,6 +181,7 @@ document.addEventListener('DOMContentLoaded', async function () {
     // Setup navbar search
     if (navbarSearchInput && navbarSearchResults) {
         let searchTimeout;
+        navbarSearchInput.addEventListener('focus', ensureSources);
         navbarSearchInput.addEventListener('input', (e) => {
             clearTimeout(searchTimeout);
             searchTimeout = setTimeout(() => {